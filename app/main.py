@@ -1,3 +1,13 @@
+import os
+
+# Limiter l'OpenMP des bibliothèques sous-jacentes (torch, OpenCV) AVANT
+# leur import : en batch, les étages qui tournent en parallèle (décodage,
+# rendu, inférence OCR) se disputeraient sinon n_cores threads chacun —
+# beaucoup de temps noyau pour un gain quasi nul. setdefault laisse la
+# main à l'utilisateur via variables d'environnement.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import sys
 from PySide6.QtWidgets import QApplication
 from app.ui.main_window import MainWindow
@@ -59,7 +59,6 @@ class BatchService:
         """
         try:
             from reportlab.lib.pagesizes import A4
-            from reportlab.lib.utils import ImageReader
             from reportlab.pdfgen import canvas
             from PIL import Image
         except ImportError:
@@ -81,19 +80,16 @@ class BatchService:
             if progress_callback:
                 progress_callback(idx, len(image_paths))
 
-            # Charger l'image
-            if isinstance(img_path, str) and img_path.endswith(('.png', '.jpg', '.jpeg')):
-                # Si c'est un chemin de fichier
-                if os.path.exists(img_path):
-                    pil_img = Image.open(img_path)
-                else:
-                    # Si c'est un array numpy (image déjà en mémoire)
-                    continue
-            else:
+            # Vérifier que c'est bien un chemin de fichier existant
+            if not (isinstance(img_path, str) and img_path.endswith(('.png', '.jpg', '.jpeg'))):
+                continue
+            if not os.path.exists(img_path):
                 continue
 
-            # Dimensions de l'image
-            img_w, img_h = pil_img.size
+            # Dimensions de l'image : lecture de l'en-tête seulement
+            # (Image.open est lazy → pas de décodage complet des pixels ici)
+            with Image.open(img_path) as pil_img:
+                img_w, img_h = pil_img.size
 
             # Calculer taille de page pour conserver aspect ratio
             a4_w, a4_h = A4
@@ -106,9 +102,9 @@ class BatchService:
             # Définir la taille de la page
             c.setPageSize((page_w, page_h))
 
-            # Dessiner l'image sur toute la page
-            img_reader = ImageReader(pil_img)
-            c.drawImage(img_reader, 0, 0, width=page_w, height=page_h)
+            # Dessiner l'image sur toute la page en passant le chemin :
+            # ReportLab décode/embarque page par page (une seule page en RAM)
+            c.drawImage(img_path, 0, 0, width=page_w, height=page_h)
 
             # Page suivante (sauf pour la dernière)
             if idx < len(image_paths):
@@ -117,6 +113,35 @@ class BatchService:
         # Sauvegarder le PDF
         c.save()
 
+    def export_single_image(
+        self,
+        original_name: str,
+        img_bgr: np.ndarray,
+        output_dir: str
+    ) -> str:
+        """
+        Exporte une image rendue (mode streaming : appelé page par page,
+        l'image peut être libérée aussitôt par l'appelant).
+
+        Args:
+            original_name: Nom du fichier d'origine
+            img_bgr: Image BGR rendue
+            output_dir: Dossier de sortie
+
+        Returns:
+            Chemin de l'image exportée
+        """
+        out_path = Path(output_dir)
+        out_path.mkdir(parents=True, exist_ok=True)
+
+        img_filename = f"{Path(original_name).stem}_traduit.png"
+        img_path = out_path / img_filename
+
+        # Compression PNG niveau 1 : écriture bien plus rapide que le
+        # niveau 3 par défaut, pour quelques % de taille en plus
+        cv2.imwrite(str(img_path), img_bgr, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        return str(img_path)
+
     def export_batch(
         self,
         rendered_images: List[Tuple[str, np.ndarray]],  # (nom_fichier, image_bgr)
@@ -152,14 +177,7 @@ class BatchService:
             if progress_callback:
                 progress_callback(idx, len(rendered_images), f"Export image {idx}/{len(rendered_images)}")
 
-            # Nom de fichier avec padding (ex: page_001.png)
-            base_name = Path(original_name).stem
-            img_filename = f"{base_name}_traduit.png"
-            img_path = out_path / img_filename
-
-            # Sauvegarder l'image
-            cv2.imwrite(str(img_path), img_bgr)
-            exported_images.append(str(img_path))
+            exported_images.append(self.export_single_image(original_name, img_bgr, output_dir))
 
         # Créer PDF multi-pages
         pdf_path = None
@@ -6,12 +6,14 @@ import re
 import os
 import time
 import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple, Optional, Callable
 from urllib.parse import urlparse, urljoin
 
 import cloudscraper
 import requests
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -25,6 +27,10 @@ from app.utils.logger import get_logger
 
 logger = get_logger("download_service")
 
+# Téléchargements HTTP simultanés (le temps devient borné par la bande
+# passante plutôt que par latence × nombre de pages)
+MAX_PARALLEL_DOWNLOADS = 8
+
 
 class DownloadService:
     """Service de téléchargement d'images depuis des URLs de manga"""
@@ -39,7 +45,20 @@ class DownloadService:
             }
         )
         # Session requests normale pour les téléchargements d'images (avec cookies Selenium)
+        # Pool de connexions dimensionné sur le nombre de téléchargements
+        # concurrents : chacun des 8 workers garde sa connexion TLS ouverte
+        # (keep-alive) au lieu de repayer handshake TCP+TLS par image
         self.download_session = requests.Session()
+        _adapter = requests.adapters.HTTPAdapter(
+            pool_connections=MAX_PARALLEL_DOWNLOADS,
+            pool_maxsize=MAX_PARALLEL_DOWNLOADS,
+            # Retry transparent sur les erreurs transitoires (coupure réseau,
+            # 5xx du CDN) : évite de perdre une page sur un hoquet ponctuel
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(500, 502, 503, 504)),
+        )
+        self.download_session.mount("https://", _adapter)
+        self.download_session.mount("http://", _adapter)
 
         self.use_selenium = False  # Fallback Selenium si cloudscraper échoue
         self.selenium_cookies = []  # Cookies récupérés de la session Selenium
@@ -202,7 +221,7 @@ class DownloadService:
                             domain=domain,
                             path=cookie.get('path', '/')
                         )
-                        logger.debug(f"  Cookie ajouté: {cookie['name']} pour domain={domain}")
+                        logger.debug("  Cookie ajouté: %s pour domain=%s", cookie['name'], domain)
 
                     logger.info(f"✅ {len(self.selenium_cookies)} cookies Selenium ajoutés pour domain + sous-domaines")
             except Exception as selenium_error:
@@ -423,64 +442,44 @@ class DownloadService:
         output_path = Path(output_folder)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        downloaded_files: List[str] = []
+        total = len(image_urls)
 
+        # Pré-calculer les noms de fichiers (l'ordre des pages vient de l'index,
+        # pas de l'ordre d'arrivée des téléchargements)
+        targets: List[Tuple[int, str, Path]] = []
         for idx, img_url in enumerate(image_urls, start=1):
-            if progress_callback:
-                progress_callback(idx, len(image_urls), f"Téléchargement image {idx}/{len(image_urls)}")
-
-            try:
-                # Déterminer l'extension depuis l'URL
-                url_ext = Path(urlparse(img_url).path).suffix
-                ext = url_ext if url_ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif'] else '.jpg'
-
-                # Nom du fichier
-                file_name = f"page_{idx:04d}{ext}"
-                file_path = output_path / file_name
+            url_ext = Path(urlparse(img_url).path).suffix
+            ext = url_ext if url_ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif'] else '.jpg'
+            targets.append((idx, img_url, output_path / f"page_{idx:04d}{ext}"))
 
-                # Si Selenium est actif, utiliser Selenium pour télécharger (contourne Cloudflare)
-                if self.selenium_driver:
-                    logger.debug(f"Téléchargement avec Selenium: {img_url}")
-                    success = self._download_image_with_selenium(img_url, file_path)
+        downloaded_files: List[str] = []
 
-                    if success:
+        if self.selenium_driver:
+            # Le driver Selenium n'est pas thread-safe → séquentiel sur ce chemin
+            for idx, img_url, file_path in targets:
+                if progress_callback:
+                    progress_callback(idx, total, f"Téléchargement image {idx}/{total}")
+
+                try:
+                    # Formatage %-paresseux : la chaîne n'est construite que si
+                    # le niveau est actif (une par image sur ce chemin chaud)
+                    logger.debug("Téléchargement avec Selenium: %s", img_url)
+                    if self._download_image_with_selenium(img_url, file_path):
                         downloaded_files.append(str(file_path))
-                        logger.info(f"✅ Téléchargé ({idx}/{len(image_urls)}): {file_name}")
+                        logger.info("✅ Téléchargé (%d/%d): %s", idx, total, file_path.name)
                         continue
-                    else:
-                        logger.warning(f"⚠️ Échec Selenium pour {img_url}, essai avec requests...")
-
-                # Fallback: télécharger avec requests
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Sec-Fetch-Dest': 'image',
-                    'Sec-Fetch-Mode': 'no-cors',
-                    'Sec-Fetch-Site': 'same-site',
-                }
-                if referer:
-                    headers['Referer'] = referer
-
-                response = self.download_session.get(img_url, headers=headers, timeout=30)
-                response.raise_for_status()
 
-                # Sauvegarder
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
+                    logger.warning(f"⚠️ Échec Selenium pour {img_url}, essai avec requests...")
+                    self._download_one_image(img_url, file_path, referer=referer)
+                    downloaded_files.append(str(file_path))
+                    logger.info("✅ Téléchargé (%d/%d): %s", idx, total, file_path.name)
 
-                downloaded_files.append(str(file_path))
-                logger.info(f"✅ Téléchargé ({idx}/{len(image_urls)}): {file_name}")
-
-            except Exception as e:
-                print(f"⚠️ Erreur lors du téléchargement de {img_url}: {e}")
-                # Continuer avec les autres images
-                continue
+                except Exception as e:
+                    print(f"⚠️ Erreur lors du téléchargement de {img_url}: {e}")
+                    # Continuer avec les autres images
+                    continue
 
-        # Fermer le driver Selenium si présent
-        if self.selenium_driver:
+            # Fermer le driver Selenium
             try:
                 logger.info("🔒 Fermeture du driver Selenium")
                 self.selenium_driver.quit()
@@ -488,11 +487,72 @@ class DownloadService:
             except Exception as e:
                 logger.warning(f"Erreur lors de la fermeture du driver: {e}")
 
+        else:
+            # Chemin requests : GETs concurrents sur la même session
+            # (pool de connexions keep-alive partagé)
+            executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS)
+            try:
+                futures = {
+                    executor.submit(self._download_one_image, img_url, file_path, referer): (img_url, file_path)
+                    for _idx, img_url, file_path in targets
+                }
+
+                done = 0
+                for fut in as_completed(futures):
+                    img_url, file_path = futures[fut]
+                    done += 1
+
+                    # Le callback peut lever InterruptedError (bouton Arrêter) :
+                    # le finally annule alors les téléchargements restants
+                    if progress_callback:
+                        progress_callback(done, total, f"Téléchargement image {done}/{total}")
+
+                    try:
+                        fut.result()
+                        downloaded_files.append(str(file_path))
+                        logger.info("✅ Téléchargé (%d/%d): %s", done, total, file_path.name)
+                    except Exception as e:
+                        print(f"⚠️ Erreur lors du téléchargement de {img_url}: {e}")
+
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            # Remettre les pages dans l'ordre (noms zéro-paddés)
+            downloaded_files.sort()
+
         if not downloaded_files:
             raise RuntimeError("Aucune image n'a pu être téléchargée")
 
         return downloaded_files
 
+    def _download_one_image(self, img_url: str, file_path: Path, referer: Optional[str] = None) -> None:
+        """
+        Télécharge une image via la session requests (appelable en parallèle).
+
+        Args:
+            img_url: URL de l'image
+            file_path: Chemin de sortie
+            referer: URL de référence (optionnel, pour éviter les blocages)
+        """
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Sec-Fetch-Dest': 'image',
+            'Sec-Fetch-Mode': 'no-cors',
+            'Sec-Fetch-Site': 'same-site',
+        }
+        if referer:
+            headers['Referer'] = referer
+
+        response = self.download_session.get(img_url, headers=headers, timeout=30)
+        response.raise_for_status()
+
+        with open(file_path, 'wb') as f:
+            f.write(response.content)
+
     def download_chapter(
         self,
         chapter_url: str,
@@ -530,10 +590,19 @@ class DownloadService:
         if progress_callback:
             progress_callback(20, 100, f"Téléchargement de {len(image_urls)} images...")
 
+        # Remappe la progression des images sur la tranche 20..100 %.
+        # Résolu UNE fois ici : pas de test "if progress_callback" ni de
+        # lambda conditionnelle payés à chaque tick de téléchargement.
+        if progress_callback:
+            def scaled_progress(i, t, s):
+                progress_callback(20 + int((i / t) * 80), 100, s)
+        else:
+            scaled_progress = None
+
         downloaded_files = self.download_images(
             image_urls,
             str(chapter_folder),
-            progress_callback=lambda i, t, s: progress_callback(20 + int((i/t) * 80), 100, s) if progress_callback else None,
+            progress_callback=scaled_progress,
             referer=chapter_url
         )
 
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# app/services/image_loader.py
+from __future__ import annotations
+
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+def load_image_bgr(img_path: str) -> Optional[np.ndarray]:
+    """
+    Décode une image en BGR via lecture brute + cv2.imdecode.
+
+    Contrairement à cv2.imread, np.fromfile lit les chemins Unicode
+    (accents fréquents dans les noms de mangas sous Windows), et la
+    lecture disque est un seul gros read séquentiel.
+
+    Returns:
+        Image BGR, ou None si le fichier est illisible/corrompu
+    """
+    try:
+        raw = np.fromfile(img_path, dtype=np.uint8)
+    except OSError:
+        return None
+    if raw.size == 0:
+        return None
+    return cv2.imdecode(raw, cv2.IMREAD_COLOR)
@@ -3,10 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+import threading
 import time
 import cv2
 import numpy as np
+from PIL import Image, ImageOps
 
+from app.utils.hashing import image_content_key
 from app.utils.logger import get_logger
 
 logger = get_logger("ocr_service")
@@ -30,6 +33,13 @@ Result = Tuple[str, float, Box]    # (text, conf, box)
 
 @dataclass
 class OcrPack:
+    """
+    Résultat brut d'un OCR, gardé en cache.
+
+    Les tableaux sont partagés par référence entre OCR, aperçu et rendu
+    (tous les workers sont des threads du même processus) : une page n'est
+    décodée qu'une fois et jamais recopiée entre étapes.
+    """
     img_for_merge: np.ndarray      # image used for OCR coords (after resize/preprocess)
     results: List[Result]          # boxes in the coords of img_for_merge
     orig_img: np.ndarray           # original image (full size)
@@ -258,14 +268,31 @@ def _merge_by_bubbles(img_bgr: np.ndarray, results: List[Result]) -> List[Result
 class OCRService:
     def __init__(self):
         self._cache: Dict[str, OcrPack] = {}
+        # Cache par contenu : pages identiques sous des chemins différents
+        # (re-téléchargements, logos/recaps répétés) sautent l'OCR complet
+        self._content_cache: Dict[str, OcrPack] = {}
         self.last_output_img: Optional[np.ndarray] = None
 
         self.reader: Any = None  # EasyOCR Reader (type: easyocr.Reader)
 
+        # EasyOCR n'est pas thread-safe : un seul moteur persistant, et tous
+        # les appels d'inférence (mono-image + batch) sont sérialisés dessus
+        self._ocr_lock = threading.Lock()
+
+        # Verrou dédié aux caches : la phase OCR du batch appelle
+        # _run_raw_ocr depuis 8 threads, insertion + éviction FIFO doivent
+        # être atomiques (deux threads qui élisent le même doyen → KeyError
+        # sur le second del, et la page échoue pour rien)
+        self._cache_lock = threading.Lock()
+
     def prepare_preview(self, image_path: str, lang_code: str):
         """
         Returns the preprocessed image used for OCR (resize + preprocess),
         to display right after loading (avoid change before/after).
+
+        L'OCR complet est lancé ici et mis en cache : le clic "Lancer OCR"
+        qui suit sur la même image/langue est un hit instantané (aucun
+        second pré-traitement ni seconde inférence).
         """
         # Lancer l'OCR (sera mis en cache)
         pack = self._run_raw_ocr(image_path, lang_code)
@@ -273,6 +300,60 @@ class OCRService:
         # Retourner l'image exacte qui sera affichée après OCR
         return pack.img_for_merge
 
+    def get_cached_original(self, img_path: str) -> Optional[np.ndarray]:
+        """
+        Retourne l'image originale décodée si encore en cache (évite un imread).
+        """
+        prefix = f"{img_path}|w{MAX_WIDTH_FOR_OCR}|"
+        with self._cache_lock:
+            for key, pack in self._cache.items():
+                if key.startswith(prefix):
+                    return pack.orig_img
+        return None
+
+    def warmup(self, lang_code: str = "en") -> None:
+        """
+        Initialise le moteur en avance (chargement des modèles + une
+        inférence factice 64×64 pour payer l'init CUDA/cuDNN maintenant).
+
+        Pensé pour être appelé depuis un thread d'arrière-plan au démarrage :
+        le verrou interne sérialise avec un éventuel vrai OCR simultané.
+        """
+        try:
+            with self._ocr_lock:
+                if self.reader is not None:
+                    return
+                self._ensure_reader(lang_code)
+                dummy = np.full((64, 64, 3), 255, dtype=np.uint8)
+                self.reader.readtext(dummy)
+        except Exception as e:
+            # warning (pas debug) : un warmup qui échoue silencieusement
+            # redonne le stall de chargement au premier clic
+            logger.warning(f"⚠️ Warmup OCR ignoré : {e}")
+
+    def unload(self) -> None:
+        """
+        Libère le Reader EasyOCR (et la VRAM GPU associée).
+
+        Le reader est rechargé lazily par _ensure_reader au prochain run() :
+        on ne perd que le temps d'initialisation, pas de fonctionnalité.
+        """
+        with self._ocr_lock:
+            if self.reader is None:
+                return
+
+            self.reader = None
+
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except Exception:
+                pass
+
+        if DEBUG_TIMINGS:
+            logger.info("💤 EasyOCR déchargé (mémoire libérée)")
+
     def _ensure_reader(self, lang_code: str) -> None:
         """Initialize EasyOCR reader (lazy load)"""
         if self.reader is not None:
@@ -316,8 +397,10 @@ class OCRService:
     def _run_raw_ocr(self, img_path: str, lang_code: str) -> OcrPack:
         t0 = time.perf_counter()
 
-        # Cache
-        cache_key = f"{img_path}|w{MAX_WIDTH_FOR_OCR}"
+        # Cache (clé = chemin + largeur + langue : l'aperçu de on_choose_image
+        # pré-remplit l'entrée que run() réutilisera, mais un changement de
+        # langue source doit invalider le résultat, pas le servir tel quel)
+        cache_key = f"{img_path}|w{MAX_WIDTH_FOR_OCR}|{lang_code}"
         if CACHE_ENABLED and cache_key in self._cache:
             if DEBUG_TIMINGS:
                 logger.debug("Cache hit (OCR) -> instant")
@@ -328,23 +411,16 @@ class OCRService:
 
         # Read image with EXIF orientation correction (optimized single-load)
         try:
-            from PIL import Image, ImageOps
-
             # Load with PIL, apply EXIF rotation automatically
             pil_img = Image.open(img_path)
             pil_img = ImageOps.exif_transpose(pil_img)  # Auto-rotate based on EXIF
 
-            # Convert PIL → OpenCV BGR
-            import numpy as np
-            img_rgb = np.array(pil_img)
-            if img_rgb.ndim == 2:  # Grayscale
-                img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_GRAY2BGR)
-            elif img_rgb.shape[2] == 3:  # RGB
-                img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR)
-            elif img_rgb.shape[2] == 4:  # RGBA
-                img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_RGBA2BGR)
-            else:
-                raise ValueError(f"Format d'image non supporté: {img_rgb.shape}")
+            # Fused convert: un seul passage C pour gris/RGBA/palette → RGB,
+            # puis une seule conversion RGB → BGR (au lieu d'une branche par format)
+            if pil_img.mode != "RGB":
+                pil_img = pil_img.convert("RGB")
+
+            img_bgr = cv2.cvtColor(np.asarray(pil_img), cv2.COLOR_RGB2BGR)
 
         except Exception as e:
             if DEBUG_TIMINGS:
@@ -362,14 +438,26 @@ class OCRService:
 
         t_resize = time.perf_counter()
 
-        # Initialize EasyOCR
-        self._ensure_reader(lang_code)
-
-        # Run EasyOCR
+        # Cache par contenu (hash blake2b de l'image décodée + langue)
+        content_key: Optional[str] = None
+        if CACHE_ENABLED:
+            content_key = f"{image_content_key(img_for_ocr)}|{lang_code}"
+            cached_pack = self._content_cache.get(content_key)
+            if cached_pack is not None:
+                if DEBUG_TIMINGS:
+                    logger.debug("Cache hit (contenu) -> OCR sauté")
+                with self._cache_lock:
+                    self._cache[cache_key] = cached_pack
+                self.last_output_img = cached_pack.img_for_merge
+                return cached_pack
+
+        # Initialize EasyOCR + inference, sérialisés sur le moteur partagé
         # readtext returns: List[Tuple[bbox, text, confidence]]
         # bbox is [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-        assert self.reader is not None, "Reader should be initialized"
-        raw_results = self.reader.readtext(img_for_ocr)
+        with self._ocr_lock:
+            self._ensure_reader(lang_code)
+            assert self.reader is not None, "Reader should be initialized"
+            raw_results = self.reader.readtext(img_for_ocr)
 
         t_ocr = time.perf_counter()
 
@@ -399,11 +487,18 @@ class OCRService:
         )
 
         if CACHE_ENABLED:
-            # LRU eviction: remove oldest if cache full
-            if len(self._cache) >= CACHE_MAX_SIZE:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-            self._cache[cache_key] = pack
+            with self._cache_lock:
+                # LRU eviction: remove oldest if cache full
+                if len(self._cache) >= CACHE_MAX_SIZE:
+                    oldest_key = next(iter(self._cache))
+                    del self._cache[oldest_key]
+                self._cache[cache_key] = pack
+
+                if content_key is not None:
+                    if len(self._content_cache) >= CACHE_MAX_SIZE:
+                        oldest_key = next(iter(self._content_cache))
+                        del self._content_cache[oldest_key]
+                    self._content_cache[content_key] = pack
 
         if DEBUG_TIMINGS:
             logger.debug(
@@ -426,7 +521,8 @@ class OCRService:
         t1 = time.perf_counter()
 
         if DEBUG_TIMINGS:
-            logger.debug(f"fusion={int((t1 - t0)*1000)}ms | lines={len(pack.results)} -> merged={len(merged)}")
+            logger.debug("fusion=%dms | lines=%d -> merged=%d",
+                         int((t1 - t0) * 1000), len(pack.results), len(merged))
 
         # Show the OCR image directly so boxes stay aligned 1:1
         self.last_output_img = pack.img_for_merge
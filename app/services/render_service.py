@@ -1,339 +1,444 @@
-# -*- coding: utf-8 -*-
-# app/services/render_service.py
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
-
-import cv2
-import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-
-from app.utils.logger import get_logger
-
-logger = get_logger("render_service")
-
-
-# ---------------------------
-# Configuration
-# ---------------------------
-
-@dataclass
-class RenderConfig:
-    """Configuration pour le rendu du texte"""
-    # Inpainting
-    inpaint_radius: int = 15  # Rayon d'inpainting (pixels) - augmenté pour meilleure reconstruction
-
-    # Marges internes (% de la largeur/hauteur de la box)
-    margin_horizontal: float = 0.10  # 10% de marge horizontale
-    margin_vertical: float = 0.10    # 10% de marge verticale
-
-    # Texte
-    font_path: Optional[str] = None  # Chemin vers police .ttf (None = police par défaut)
-    font_color: Tuple[int, int, int] = (0, 0, 0)  # Noir par défaut (RGB)
-    max_font_size: int = 100  # Taille max de police
-    min_font_size: int = 8    # Taille min de police
-    line_spacing: float = 1.2  # Espacement entre lignes (multiplicateur)
-
-
-Box = List[List[int]]  # [[x,y], [x,y], [x,y], [x,y]]
-
-
-# ---------------------------
-# Utilitaires géométriques
-# ---------------------------
-
-def _poly_to_aabb(poly: Box) -> Tuple[int, int, int, int]:
-    """Convertit un polygone en bounding box (x1, y1, x2, y2)"""
-    xs = [p[0] for p in poly]
-    ys = [p[1] for p in poly]
-    return int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
-
-
-# ---------------------------
-# Inpainting
-# ---------------------------
-
-def _create_mask_from_box(img_shape: Tuple[int, int], box: Box) -> np.ndarray:
-    """
-    Cr�e un masque binaire pour la zone de la box.
-
-    Args:
-        img_shape: (height, width) de l'image
-        box: Polygone de la box
-
-    Returns:
-        Masque binaire (255 = zone � inpainter, 0 = reste)
-    """
-    h, w = img_shape
-    mask = np.zeros((h, w), dtype=np.uint8)
-
-    # Convertir box en numpy array pour fillPoly
-    pts = np.array(box, dtype=np.int32)
-    cv2.fillPoly(mask, [pts], 255)
-
-    return mask
-
-
-def inpaint_text(img_bgr: np.ndarray, box: Box, config: RenderConfig) -> np.ndarray:
-    """
-    Efface le texte dans la box en utilisant l'inpainting OpenCV.
-
-    Args:
-        img_bgr: Image BGR (OpenCV)
-        box: Polygone de la box contenant le texte
-        config: Configuration de rendu
-
-    Returns:
-        Image avec texte effac�
-    """
-    h, w = img_bgr.shape[:2]
-
-    # Cr�er masque pour la zone � inpainter
-    mask = _create_mask_from_box((h, w), box)
-
-    # Inpainting (reconstruction du fond)
-    # cv2.INPAINT_TELEA : m�thode rapide et efficace
-    inpainted = cv2.inpaint(
-        img_bgr,
-        mask,
-        inpaintRadius=config.inpaint_radius,
-        flags=cv2.INPAINT_TELEA
-    )
-
-    return inpainted
-
-
-# ---------------------------
-# Rendu texte
-# ---------------------------
-
-def _get_default_font(size: int):
-    """Retourne une police par d�faut"""
-    try:
-        # Essayer police system (Windows)
-        return ImageFont.truetype("arial.ttf", size)
-    except Exception:
-        try:
-            # Fallback : DejaVu (Linux/cross-platform)
-            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
-        except Exception:
-            # Derni�re option : police bitmap par d�faut
-            return ImageFont.load_default()
-
-
-def _load_font(font_path: Optional[str], size: int):
-    """Charge une police TrueType"""
-    if font_path:
-        try:
-            return ImageFont.truetype(font_path, size)
-        except Exception as e:
-            logger.warning(f"⚠️ Impossible de charger la police {font_path}: {e}")
-            logger.info("   → Utilisation de la police par défaut")
-
-    return _get_default_font(size)
-
-
-def _wrap_text(text: str, font, max_width: int) -> List[str]:
-    """
-    D�coupe le texte en lignes pour qu'il tienne dans max_width.
-
-    Args:
-        text: Texte � d�couper
-        font: Police utilis�e
-        max_width: Largeur maximale en pixels
-
-    Returns:
-        Liste de lignes
-    """
-    words = text.split()
-    if not words:
-        return []
-
-    lines: List[str] = []
-    current_line = words[0]
-
-    for word in words[1:]:
-        # Tester si on peut ajouter le mot � la ligne courante
-        test_line = f"{current_line} {word}"
-        bbox = font.getbbox(test_line)
-        width = bbox[2] - bbox[0]
-
-        if width <= max_width:
-            current_line = test_line
-        else:
-            # Ligne trop longue, cr�er nouvelle ligne
-            lines.append(current_line)
-            current_line = word
-
-    # Ajouter derni�re ligne
-    lines.append(current_line)
-
-    return lines
-
-
-def _find_optimal_font_size(
-    text: str,
-    box_width: int,
-    box_height: int,
-    font_path: Optional[str],
-    config: RenderConfig
-):
-    """
-    Trouve la taille de police optimale pour que le texte tienne dans la box.
-
-    Returns:
-        (font, lignes_wrapped, font_size)
-    """
-    # Dichotomie sur la taille de police
-    min_size = config.min_font_size
-    max_size = config.max_font_size
-    best_font = _load_font(font_path, min_size)
-    best_lines = [text]
-    best_size = min_size
-
-    for font_size in range(max_size, min_size - 1, -1):
-        font = _load_font(font_path, font_size)
-        lines = _wrap_text(text, font, box_width)
-
-        # Calculer hauteur totale
-        line_height = font.getbbox("Ay")[3] - font.getbbox("Ay")[1]
-        total_height = int(line_height * len(lines) * config.line_spacing)
-
-        # V�rifier si �a rentre
-        if total_height <= box_height:
-            # V�rifier largeur de chaque ligne
-            fits = True
-            for line in lines:
-                bbox = font.getbbox(line)
-                line_width = bbox[2] - bbox[0]
-                if line_width > box_width:
-                    fits = False
-                    break
-
-            if fits:
-                return font, lines, font_size
-
-    # Si rien ne rentre, retourner taille min
-    return best_font, best_lines, best_size
-
-
-def render_text_in_box(
-    img_bgr: np.ndarray,
-    text: str,
-    box: Box,
-    config: RenderConfig
-) -> np.ndarray:
-    """
-    Dessine le texte traduit dans la box.
-
-    Args:
-        img_bgr: Image BGR (OpenCV)
-        text: Texte � dessiner
-        box: Polygone de la box
-        config: Configuration de rendu
-
-    Returns:
-        Image avec texte dessin�
-    """
-    if not text.strip():
-        return img_bgr
-
-    # Convertir BGR � RGB pour Pillow
-    img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-    pil_img = Image.fromarray(img_rgb)
-    draw = ImageDraw.Draw(pil_img)
-
-    # Calculer zone de texte avec marges
-    x1, y1, x2, y2 = _poly_to_aabb(box)
-    box_w = x2 - x1
-    box_h = y2 - y1
-
-    margin_x = int(box_w * config.margin_horizontal)
-    margin_y = int(box_h * config.margin_vertical)
-
-    text_w = box_w - 2 * margin_x
-    text_h = box_h - 2 * margin_y
-
-    if text_w <= 0 or text_h <= 0:
-        logger.warning(f"⚠️ Box trop petite pour le texte : {box_w}x{box_h}")
-        return img_bgr
-
-    # Trouver taille de police optimale
-    font, lines, font_size = _find_optimal_font_size(
-        text, text_w, text_h, config.font_path, config
-    )
-
-    # Calculer position Y de d�part (centrage vertical)
-    line_height = font.getbbox("Ay")[3] - font.getbbox("Ay")[1]
-    total_text_height = int(line_height * len(lines) * config.line_spacing)
-    y_start = y1 + margin_y + (text_h - total_text_height) // 2
-
-    # Dessiner chaque ligne (centrage horizontal)
-    y_current = y_start
-    for line in lines:
-        bbox = font.getbbox(line)
-        line_width = bbox[2] - bbox[0]
-
-        # Centrage horizontal
-        x_pos = x1 + margin_x + (text_w - line_width) // 2
-        y_pos = y_current
-
-        # Dessiner texte
-        draw.text((x_pos, y_pos), line, font=font, fill=config.font_color)
-
-        y_current += int(line_height * config.line_spacing)
-
-    # Convertir RGB � BGR pour OpenCV
-    img_rgb_result = np.array(pil_img)
-    img_bgr_result = cv2.cvtColor(img_rgb_result, cv2.COLOR_RGB2BGR)
-
-    return img_bgr_result
-
-
-# ---------------------------
-# RenderService (API principale)
-# ---------------------------
-
-class RenderService:
-    """Service de rendu (inpainting + texte)"""
-
-    def __init__(self, config: Optional[RenderConfig] = None):
-        self.config = config or RenderConfig()
-
-    def set_config(self, config: RenderConfig) -> None:
-        """Met � jour la configuration"""
-        self.config = config
-
-    def render_translated_image(
-        self,
-        img_bgr: np.ndarray,
-        boxes: List[Box],
-        translations: List[str]
-    ) -> np.ndarray:
-        """
-        Traite une image compl�te : inpainting + rendu texte.
-
-        Args:
-            img_bgr: Image BGR (OpenCV)
-            boxes: Liste des boxes de texte
-            translations: Textes traduits (m�me ordre que boxes)
-
-        Returns:
-            Image finale avec texte traduit
-        """
-        if len(boxes) != len(translations):
-            raise ValueError(f"Nombre de boxes ({len(boxes)}) != nombre de traductions ({len(translations)})")
-
-        # Copie pour ne pas modifier l'original
-        result = img_bgr.copy()
-
-        # �tape 1 : Inpainting (effacer tout le texte)
-        for box in boxes:
-            result = inpaint_text(result, box, self.config)
-
-        # �tape 2 : Dessiner texte traduit
-        for box, text in zip(boxes, translations):
-            result = render_text_in_box(result, text, box, self.config)
-
-        return result
+# -*- coding: utf-8 -*-
+# app/services/render_service.py
+from __future__ import annotations
+
+import functools
+import threading
+from dataclasses import dataclass
+from typing import List, Tuple, Optional
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from app.utils.logger import get_logger
+
+logger = get_logger("render_service")
+
+
+# ---------------------------
+# Configuration
+# ---------------------------
+
+@dataclass
+class RenderConfig:
+    """Configuration pour le rendu du texte"""
+    # Inpainting
+    inpaint_radius: int = 15  # Rayon d'inpainting (pixels) - augmenté pour meilleure reconstruction
+
+    # Marges internes (% de la largeur/hauteur de la box)
+    margin_horizontal: float = 0.10  # 10% de marge horizontale
+    margin_vertical: float = 0.10    # 10% de marge verticale
+
+    # Texte
+    font_path: Optional[str] = None  # Chemin vers police .ttf (None = police par défaut)
+    font_color: Tuple[int, int, int] = (0, 0, 0)  # Noir par défaut (RGB)
+    max_font_size: int = 100  # Taille max de police
+    min_font_size: int = 8    # Taille min de police
+    line_spacing: float = 1.2  # Espacement entre lignes (multiplicateur)
+
+
+Box = List[List[int]]  # [[x,y], [x,y], [x,y], [x,y]]
+
+
+# ---------------------------
+# Utilitaires géométriques
+# ---------------------------
+
+def _poly_to_aabb(poly: Box) -> Tuple[int, int, int, int]:
+    """Convertit un polygone en bounding box (x1, y1, x2, y2)"""
+    xs = [p[0] for p in poly]
+    ys = [p[1] for p in poly]
+    return int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
+
+
+# ---------------------------
+# Inpainting
+# ---------------------------
+
+def _create_mask_from_boxes(
+    img_shape: Tuple[int, int],
+    boxes: List[Box],
+    mask_buf: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Cr�e un masque binaire couvrant toutes les boxes en un seul passage.
+
+    Args:
+        img_shape: (height, width) de l'image
+        boxes: Polygones des boxes
+        mask_buf: Buffer optionnel à réutiliser (remis à zéro, évite un malloc)
+
+    Returns:
+        Masque binaire (255 = zone � inpainter, 0 = reste)
+    """
+    h, w = img_shape
+    if mask_buf is not None and mask_buf.shape == (h, w):
+        mask = mask_buf
+        mask.fill(0)
+    else:
+        mask = np.zeros((h, w), dtype=np.uint8)
+
+    # fillPoly accepte un tableau (N, 4, 2) → un seul appel C pour toutes
+    # les boxes, sans construire une liste d'arrays intermédiaire
+    pts = np.asarray(boxes, dtype=np.int32)
+    if pts.size:
+        cv2.fillPoly(mask, pts, 255)
+
+    return mask
+
+
+def inpaint_text(
+    img_bgr: np.ndarray,
+    boxes: List[Box],
+    config: RenderConfig,
+    mask_buf: Optional[np.ndarray] = None,
+    dst: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Efface le texte de toutes les boxes en utilisant l'inpainting OpenCV.
+
+    Un seul masque combiné + un seul cv2.inpaint : évite N copies complètes
+    de l'image (une par box) quand la page contient beaucoup de bulles.
+
+    Args:
+        img_bgr: Image BGR (OpenCV)
+        boxes: Polygones des boxes contenant le texte
+        config: Configuration de rendu
+        mask_buf: Buffer de masque optionnel à réutiliser entre pages
+        dst: Buffer de sortie optionnel à réutiliser entre pages
+
+    Returns:
+        Image avec texte effac�
+    """
+    if len(boxes) == 0:
+        return img_bgr
+
+    h, w = img_bgr.shape[:2]
+
+    # Cr�er masque combiné pour toutes les zones � inpainter
+    mask = _create_mask_from_boxes((h, w), boxes, mask_buf=mask_buf)
+
+    # Inpainting (reconstruction du fond)
+    # cv2.INPAINT_TELEA : m�thode rapide et efficace
+    if dst is not None and dst.shape == img_bgr.shape:
+        inpainted = cv2.inpaint(
+            img_bgr,
+            mask,
+            inpaintRadius=config.inpaint_radius,
+            flags=cv2.INPAINT_TELEA,
+            dst=dst
+        )
+    else:
+        inpainted = cv2.inpaint(
+            img_bgr,
+            mask,
+            inpaintRadius=config.inpaint_radius,
+            flags=cv2.INPAINT_TELEA
+        )
+
+    return inpainted
+
+
+# ---------------------------
+# Rendu texte
+# ---------------------------
+
+@functools.lru_cache(maxsize=256)
+def _get_default_font(size: int):
+    """Retourne une police par d�faut (mise en cache par taille)"""
+    try:
+        # Essayer police system (Windows)
+        return ImageFont.truetype("arial.ttf", size)
+    except Exception:
+        try:
+            # Fallback : DejaVu (Linux/cross-platform)
+            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
+        except Exception:
+            # Derni�re option : police bitmap par d�faut
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=256)
+def _load_font(font_path: Optional[str], size: int):
+    """
+    Charge une police TrueType (mise en cache par (chemin, taille)).
+
+    _find_optimal_font_size sonde des dizaines de tailles par bulle : sans
+    cache, chaque sonde relit le .ttf sur disque et re-rasterise les glyphes.
+    Avec le cache lru, un (chemin, taille) donné n'est chargé qu'une seule
+    fois par processus — FreeType conserve ensuite ses glyphes rasterisés
+    dans l'objet ImageFont réutilisé.
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception as e:
+            logger.warning(f"⚠️ Impossible de charger la police {font_path}: {e}")
+            logger.info("   → Utilisation de la police par défaut")
+
+    return _get_default_font(size)
+
+
+def _wrap_text(text: str, font, max_width: int) -> List[str]:
+    """
+    D�coupe le texte en lignes pour qu'il tienne dans max_width.
+
+    Args:
+        text: Texte � d�couper
+        font: Police utilis�e
+        max_width: Largeur maximale en pixels
+
+    Returns:
+        Liste de lignes
+    """
+    words = text.split()
+    if not words:
+        return []
+
+    lines: List[str] = []
+    current_line = words[0]
+
+    for word in words[1:]:
+        # Tester si on peut ajouter le mot � la ligne courante
+        test_line = f"{current_line} {word}"
+        bbox = font.getbbox(test_line)
+        width = bbox[2] - bbox[0]
+
+        if width <= max_width:
+            current_line = test_line
+        else:
+            # Ligne trop longue, cr�er nouvelle ligne
+            lines.append(current_line)
+            current_line = word
+
+    # Ajouter derni�re ligne
+    lines.append(current_line)
+
+    return lines
+
+
+def _find_optimal_font_size(
+    text: str,
+    box_width: int,
+    box_height: int,
+    font_path: Optional[str],
+    config: RenderConfig
+):
+    """
+    Trouve la taille de police optimale pour que le texte tienne dans la box.
+
+    Returns:
+        (font, lignes_wrapped, font_size)
+    """
+    # Dichotomie sur la taille de police
+    min_size = config.min_font_size
+    max_size = config.max_font_size
+    best_font = _load_font(font_path, min_size)
+    best_lines = [text]
+    best_size = min_size
+
+    for font_size in range(max_size, min_size - 1, -1):
+        font = _load_font(font_path, font_size)
+        lines = _wrap_text(text, font, box_width)
+
+        # Calculer hauteur totale
+        line_height = font.getbbox("Ay")[3] - font.getbbox("Ay")[1]
+        total_height = int(line_height * len(lines) * config.line_spacing)
+
+        # V�rifier si �a rentre
+        if total_height <= box_height:
+            # V�rifier largeur de chaque ligne
+            fits = True
+            for line in lines:
+                bbox = font.getbbox(line)
+                line_width = bbox[2] - bbox[0]
+                if line_width > box_width:
+                    fits = False
+                    break
+
+            if fits:
+                return font, lines, font_size
+
+    # Si rien ne rentre, retourner taille min
+    return best_font, best_lines, best_size
+
+
+def _draw_text_in_box(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    box: Box,
+    config: RenderConfig,
+    aabb: Optional[Tuple[int, int, int, int]] = None
+) -> None:
+    """
+    Dessine le texte traduit dans la box, sur un ImageDraw existant.
+
+    Args:
+        draw: Contexte de dessin Pillow (image déjà convertie en RGB)
+        text: Texte � dessiner
+        box: Polygone de la box
+        config: Configuration de rendu
+        aabb: Bounding box (x1, y1, x2, y2) pré-calculée (sinon dérivée de box)
+    """
+    if not text.strip():
+        return
+
+    # Calculer zone de texte avec marges
+    x1, y1, x2, y2 = aabb if aabb is not None else _poly_to_aabb(box)
+    box_w = x2 - x1
+    box_h = y2 - y1
+
+    margin_x = int(box_w * config.margin_horizontal)
+    margin_y = int(box_h * config.margin_vertical)
+
+    text_w = box_w - 2 * margin_x
+    text_h = box_h - 2 * margin_y
+
+    if text_w <= 0 or text_h <= 0:
+        logger.warning(f"⚠️ Box trop petite pour le texte : {box_w}x{box_h}")
+        return
+
+    # Trouver taille de police optimale
+    font, lines, font_size = _find_optimal_font_size(
+        text, text_w, text_h, config.font_path, config
+    )
+
+    # Calculer position Y de d�part (centrage vertical)
+    line_height = font.getbbox("Ay")[3] - font.getbbox("Ay")[1]
+    total_text_height = int(line_height * len(lines) * config.line_spacing)
+    y_start = y1 + margin_y + (text_h - total_text_height) // 2
+
+    # Dessiner chaque ligne (centrage horizontal)
+    y_current = y_start
+    for line in lines:
+        bbox = font.getbbox(line)
+        line_width = bbox[2] - bbox[0]
+
+        # Centrage horizontal
+        x_pos = x1 + margin_x + (text_w - line_width) // 2
+        y_pos = y_current
+
+        # Dessiner texte
+        draw.text((x_pos, y_pos), line, font=font, fill=config.font_color)
+
+        y_current += int(line_height * config.line_spacing)
+
+
+def render_text_in_box(
+    img_bgr: np.ndarray,
+    text: str,
+    box: Box,
+    config: RenderConfig
+) -> np.ndarray:
+    """
+    Dessine le texte traduit dans la box (variante mono-box autonome).
+
+    Args:
+        img_bgr: Image BGR (OpenCV)
+        text: Texte � dessiner
+        box: Polygone de la box
+        config: Configuration de rendu
+
+    Returns:
+        Image avec texte dessin�
+    """
+    if not text.strip():
+        return img_bgr
+
+    # Convertir BGR � RGB pour Pillow
+    img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+    pil_img = Image.fromarray(img_rgb)
+    draw = ImageDraw.Draw(pil_img)
+
+    _draw_text_in_box(draw, text, box, config)
+
+    # Convertir RGB � BGR pour OpenCV
+    img_rgb_result = np.array(pil_img)
+    img_bgr_result = cv2.cvtColor(img_rgb_result, cv2.COLOR_RGB2BGR)
+
+    return img_bgr_result
+
+
+# ---------------------------
+# RenderService (API principale)
+# ---------------------------
+
+class RenderService:
+    """Service de rendu (inpainting + texte)"""
+
+    def __init__(self, config: Optional[RenderConfig] = None):
+        self.config = config or RenderConfig()
+
+        # Buffers réutilisés d'une page à l'autre (principe "allouer une fois") :
+        # les pages d'un même chapitre ont presque toujours la même taille,
+        # donc ces buffers ne sont réalloués qu'au changement de dimensions.
+        # Stockés par thread : le batch rend plusieurs pages en parallèle,
+        # chaque thread du pool garde sa propre paire de buffers.
+        self._buffers = threading.local()
+
+    def set_config(self, config: RenderConfig) -> None:
+        """Met � jour la configuration"""
+        self.config = config
+
+    def render_translated_image(
+        self,
+        img_bgr: np.ndarray,
+        boxes: List[Box],
+        translations: List[str]
+    ) -> np.ndarray:
+        """
+        Traite une image compl�te : inpainting + rendu texte.
+
+        Args:
+            img_bgr: Image BGR (OpenCV)
+            boxes: Liste des boxes de texte
+            translations: Textes traduits (m�me ordre que boxes)
+
+        Returns:
+            Image finale avec texte traduit
+        """
+        if len(boxes) != len(translations):
+            raise ValueError(f"Nombre de boxes ({len(boxes)}) != nombre de traductions ({len(translations)})")
+
+        # Boxes converties une seule fois en tableau (N, 4, 2) : le masque
+        # d'inpainting et les AABB par bulle se calculent vectorisés dessus
+        boxes_arr = np.asarray(boxes, dtype=np.int32).reshape(-1, 4, 2)
+
+        # Préparer les buffers réutilisables (réalloués seulement si la taille change)
+        h, w = img_bgr.shape[:2]
+        buf = self._buffers
+        if getattr(buf, "mask", None) is None or buf.mask.shape != (h, w):
+            buf.mask = np.empty((h, w), dtype=np.uint8)
+            buf.inpaint = np.empty((h, w, 3), dtype=np.uint8)
+            buf.rgb = np.empty((h, w, 3), dtype=np.uint8)
+
+        # �tape 1 : Inpainting (un seul masque combiné, un seul appel cv2.inpaint)
+        result = inpaint_text(
+            img_bgr, boxes_arr, self.config,
+            mask_buf=buf.mask, dst=buf.inpaint
+        )
+        if result is img_bgr:
+            # Copie pour ne pas modifier l'original (aucune box → inpaint no-op)
+            result = img_bgr.copy()
+
+        # �tape 2 : Dessiner tout le texte traduit sur une seule conversion BGR↔RGB
+        # (conversion écrite dans le scratch RGB réutilisé : pas d'alloc pleine
+        # page par rendu ; Pillow copie ensuite dans son propre stockage)
+        cv2.cvtColor(result, cv2.COLOR_BGR2RGB, dst=buf.rgb)
+        pil_img = Image.fromarray(buf.rgb)
+        draw = ImageDraw.Draw(pil_img)
+
+        # AABB de toutes les bulles en deux réductions numpy (au lieu de
+        # min/max Python point par point dans chaque _draw_text_in_box)
+        if len(boxes_arr):
+            aabbs = np.concatenate(
+                [boxes_arr.min(axis=1), boxes_arr.max(axis=1)], axis=1
+            ).tolist()
+        else:
+            aabbs = []
+
+        for box, aabb, text in zip(boxes_arr, aabbs, translations):
+            _draw_text_in_box(draw, text, box, self.config, aabb=tuple(aabb))
+
+        return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
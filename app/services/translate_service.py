@@ -35,6 +35,11 @@ class OnlineTranslator:
     Online via DeepL API.
     """
 
+    # Limite DeepL : 50 paramètres "text" par requête. Depuis que le batch
+    # traduit tout un chapitre en un appel, la liste peut dépasser cette
+    # limite — on découpe en sous-requêtes pleines (1 round-trip / 50 textes)
+    MAX_TEXTS_PER_REQUEST = 50
+
     def __init__(self) -> None:
         # API Free (tu peux remplacer par api.deepl.com si plan pro)
         self.base_url = "https://api-free.deepl.com/v2/translate"
@@ -43,23 +48,26 @@ class OnlineTranslator:
         if not api_key.strip():
             raise TranslateError("Clé API manquante (DeepL).")
 
-        data = []
-        for t in texts:
-            data.append(("text", t))
-        data.append(("source_lang", src_lang.upper()))
-        data.append(("target_lang", tgt_lang.upper()))
-
         headers = {"Authorization": f"DeepL-Auth-Key {api_key.strip()}"}
 
-        r = requests.post(self.base_url, data=data, headers=headers, timeout=30)
-        if r.status_code != 200:
-            raise TranslateError(f"DeepL erreur {r.status_code}: {r.text[:200]}")
-
-        payload = r.json()
-        translations = payload.get("translations", [])
         out: List[str] = []
-        for tr in translations:
-            out.append(str(tr.get("text", "")))
+        for start in range(0, len(texts), self.MAX_TEXTS_PER_REQUEST):
+            chunk = texts[start:start + self.MAX_TEXTS_PER_REQUEST]
+
+            data = []
+            for t in chunk:
+                data.append(("text", t))
+            data.append(("source_lang", src_lang.upper()))
+            data.append(("target_lang", tgt_lang.upper()))
+
+            r = requests.post(self.base_url, data=data, headers=headers, timeout=30)
+            if r.status_code != 200:
+                raise TranslateError(f"DeepL erreur {r.status_code}: {r.text[:200]}")
+
+            payload = r.json()
+            for tr in payload.get("translations", []):
+                out.append(str(tr.get("text", "")))
+
         return out
 
 
@@ -99,6 +107,23 @@ class LocalTranslator:
         self._model_name = model_name
         self._loaded = True
 
+    def unload(self) -> None:
+        """Décharge le modèle MarianMT (rechargé lazily à la prochaine traduction)"""
+        if not self._loaded:
+            return
+
+        self._loaded = False
+        self._tokenizer = None
+        self._model = None
+        self._model_name = None
+
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
     def translate_many(self, texts: List[str], src_lang: str, tgt_lang: str) -> List[str]:
         self._ensure_loaded(src_lang, tgt_lang)
 
@@ -163,7 +188,18 @@ class TranslateService:
             logger.info(f"✅ Cache hit : {len(texts)} traductions récupérées du cache")
             return [r for r in cached_results if r is not None]
 
-        logger.debug(f"📊 Cache : {len(cached_results) - len(texts_to_translate)}/{len(texts)} hits, {len(texts_to_translate)} à traduire")
+        # ✅ Dédupliquer avant l'appel : SFX, onomatopées et noms répétés
+        # sur une page ne partent qu'une seule fois vers l'API/le modèle
+        unique_texts = list(dict.fromkeys(texts_to_translate))
+
+        # %-paresseux : pas de chaîne construite quand DEBUG est filtré
+        logger.debug(
+            "📊 Cache : %d/%d hits, %d à traduire (%d doublons évités)",
+            len(cached_results) - len(texts_to_translate),
+            len(texts),
+            len(unique_texts),
+            len(texts_to_translate) - len(unique_texts),
+        )
 
         # si online mais pas de clé ET pas de fallback → erreur
         if s.mode == "online" and not s.api_key.strip() and not s.auto_fallback_to_local:
@@ -174,14 +210,14 @@ class TranslateService:
         try:
             if s.mode == "online":
                 new_translations = self._online.translate_many(
-                    texts=texts_to_translate,
+                    texts=unique_texts,
                     src_lang=s.src_lang,
                     tgt_lang=s.tgt_lang,
                     api_key=s.api_key,
                 )
             else:
                 new_translations = self._local.translate_many(
-                    texts=texts_to_translate,
+                    texts=unique_texts,
                     src_lang=s.src_lang,
                     tgt_lang=s.tgt_lang,
                 )
@@ -190,14 +226,17 @@ class TranslateService:
             if s.mode == "online" and s.auto_fallback_to_local:
                 logger.warning(f"⚠️ Traduction Online échouée ({e})")
                 logger.info("🔄 Basculement automatique vers traduction Local...")
-                new_translations = self._local.translate_many(texts_to_translate, s.src_lang, s.tgt_lang)
+                new_translations = self._local.translate_many(unique_texts, s.src_lang, s.tgt_lang)
             else:
                 raise
 
         _dt = time.perf_counter() - t0
 
+        # Retrouver la traduction de chaque texte (doublons inclus)
+        new_map: Dict[str, str] = dict(zip(unique_texts, new_translations))
+
         # ✅ Mettre en cache les nouvelles traductions
-        for text, translation in zip(texts_to_translate, new_translations):
+        for text, translation in new_map.items():
             cache_key = (s.src_lang, s.tgt_lang, text)
 
             # LRU eviction si cache plein
@@ -208,18 +247,37 @@ class TranslateService:
 
             self._translation_cache[cache_key] = translation
 
-        # ✅ Reconstituer la liste complète (cache + nouvelles)
+        # ✅ Reconstituer la liste complète (cache + nouvelles, doublons résolus via new_map)
         result: List[str] = []
-        new_idx = 0
-        for i in range(len(texts)):
+        for i, text in enumerate(texts):
             if cached_results[i] is not None:
                 result.append(cached_results[i])  # type: ignore
             else:
-                result.append(new_translations[new_idx])
-                new_idx += 1
+                result.append(new_map.get(text, text))
 
         return result
 
+    def warmup(self) -> None:
+        """
+        Pré-charge le traducteur local (tokenizer + MarianMT) en avance.
+
+        Appelé depuis le thread de warmup au démarrage : en mode Local, la
+        première traduction ne paie plus le chargement du modèle. En mode
+        Online il n'y a rien à chauffer (pas de ping : chaque requête DeepL
+        consomme du quota).
+        """
+        if self.settings.mode != "local":
+            return
+
+        try:
+            self._local._ensure_loaded(self.settings.src_lang, self.settings.tgt_lang)
+        except Exception as e:
+            logger.debug(f"Warmup traduction ignoré : {e}")
+
+    def unload_local_model(self) -> None:
+        """Décharge le traducteur local (le cache de traductions est conservé)"""
+        self._local.unload()
+
     def clear_cache(self) -> None:
         """Vide le cache des traductions"""
         old_size = len(self._translation_cache)
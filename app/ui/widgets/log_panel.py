@@ -1,10 +1,46 @@
-from PySide6.QtWidgets import QTextEdit
-
-
-class LogPanel(QTextEdit):
-    def __init__(self):
-        super().__init__()
-        self.setReadOnly(True)
-
-    def log(self, message: str):
-        self.append(message)
+from typing import List
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QTextEdit
+
+
+class LogPanel(QTextEdit):
+    # Nombre max de blocs (lignes) conservés : au-delà, Qt supprime les plus
+    # anciens. Sans borne, le coût de layout du document croît en O(N) sur
+    # les longues sessions batch.
+    MAX_BLOCKS = 5000
+
+    # Fenêtre de coalescence : les messages arrivés dans cet intervalle sont
+    # fusionnés en UN append (un seul reflow/repaint du document), au lieu
+    # d'un reflow par message pendant les rafales batch/download.
+    FLUSH_INTERVAL_MS = 50
+
+    def __init__(self):
+        super().__init__()
+        self.setReadOnly(True)
+        self.document().setMaximumBlockCount(self.MAX_BLOCKS)
+
+        self._pending: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def log(self, message: str):
+        self._pending.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def log_many(self, lines: list):
+        """Ajoute plusieurs lignes d'un coup (même canal que log, un seul flush)"""
+        if not lines:
+            return
+        self._pending.extend(lines)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        self.append("\n".join(self._pending))
+        self._pending.clear()
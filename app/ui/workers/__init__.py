@@ -4,9 +4,11 @@
 from .ocr_translate_worker import OCRTranslateWorker
 from .batch_worker import BatchWorker
 from .download_worker import DownloadWorker
+from .runnable import WorkerRunnable
 
 __all__ = [
     'OCRTranslateWorker',
     'BatchWorker',
     'DownloadWorker',
+    'WorkerRunnable',
 ]
@@ -1,109 +1,223 @@
-# -*- coding: utf-8 -*-
-"""Worker for batch image processing"""
-from __future__ import annotations
-
-from pathlib import Path
-from typing import List, Tuple
-
-import cv2
-import numpy as np
-from PySide6.QtCore import QObject, Signal
-
-from app.services.ocr_service import OCRService
-from app.services.translate_service import TranslateService
-from app.services.render_service import RenderService
-from app.services.batch_service import BatchService
-
-
-class BatchWorker(QObject):
-    """Background worker for batch processing a folder of images"""
-    finished = Signal(list, str)  # (list_of_image_paths, pdf_path)
-    error = Signal(str)
-    progress = Signal(int, int, str)  # (current, total, status_text)
-
-    def __init__(
-        self,
-        folder_path: str,
-        output_dir: str,
-        chapter_name: str,
-        create_pdf: bool,
-        lang_code: str,
-        ocr_service: OCRService,
-        translate_service: TranslateService,
-        render_service: RenderService,
-        batch_service: BatchService,
-    ):
-        super().__init__()
-        self.folder_path = folder_path
-        self.output_dir = output_dir
-        self.chapter_name = chapter_name
-        self.create_pdf = create_pdf
-        self.lang_code = lang_code
-        self.ocr_service = ocr_service
-        self.translate_service = translate_service
-        self.render_service = render_service
-        self.batch_service = batch_service
-
-    def run(self):
-        """Process all images in folder"""
-        try:
-            # 1) Scan folder
-            self.progress.emit(0, 100, "Scan du dossier...")
-            image_paths = self.batch_service.scan_folder(self.folder_path)
-
-            if not image_paths:
-                self.error.emit(f"Aucune image trouvée dans : {self.folder_path}")
-                return
-
-            total_images = len(image_paths)
-            self.progress.emit(0, total_images, f"Trouvé {total_images} images")
-
-            # 2) Process each image (OCR + Translation + Render)
-            rendered_images: List[Tuple[str, np.ndarray]] = []
-
-            for idx, img_path in enumerate(image_paths, start=1):
-                img_name = Path(img_path).name
-                self.progress.emit(idx, total_images, f"Traitement {img_name} ({idx}/{total_images})")
-
-                try:
-                    # OCR
-                    ocr_results = self.ocr_service.run(img_path, self.lang_code)
-
-                    # Translation
-                    texts = [t for (t, _c, _b) in ocr_results]
-                    translations = self.translate_service.translate_many(texts) if texts else []
-
-                    # Render
-                    img_bgr = cv2.imread(img_path)
-                    if img_bgr is None:
-                        raise RuntimeError(f"Impossible de charger l'image : {img_path}")
-
-                    boxes = [b for (_t, _c, b) in ocr_results]
-                    rendered_img = self.render_service.render_translated_image(img_bgr, boxes, translations)
-
-                    rendered_images.append((img_name, rendered_img))
-
-                except Exception as e:
-                    # Continue even if one image fails
-                    self.progress.emit(idx, total_images, f"⚠ Erreur sur {img_name}: {str(e)[:50]}")
-                    continue
-
-            if not rendered_images:
-                self.error.emit("Aucune image n'a pu être traitée avec succès")
-                return
-
-            # 3) Export batch
-            self.progress.emit(total_images, total_images, "Export des images...")
-
-            exported_imgs, pdf_path = self.batch_service.export_batch(
-                rendered_images=rendered_images,
-                output_dir=self.output_dir,
-                chapter_name=self.chapter_name,
-                create_pdf=self.create_pdf,
-                progress_callback=lambda i, t, s: self.progress.emit(i, t, s)
-            )
-
-            self.finished.emit(exported_imgs, pdf_path or "")
-
-        except Exception as e:
-            self.error.emit(str(e))
+# -*- coding: utf-8 -*-
+"""Worker for batch image processing"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from app.services.image_loader import load_image_bgr
+from app.services.ocr_service import OCRService
+from app.services.translate_service import TranslateService
+from app.services.render_service import RenderService
+from app.services.batch_service import BatchService
+
+
+# (index de page, chemin, résultats OCR de la page)
+PageOcr = Tuple[int, str, list]
+
+
+class BatchWorker(QObject):
+    """Background worker for batch processing a folder of images"""
+    finished = Signal(list, str)  # (list_of_image_paths, pdf_path)
+    error = Signal(str)
+    progress = Signal(int, int, str)  # (current, total, status_text)
+
+    # Pages traitées de front : le travail est parallèle par image
+    # (décodage, rendu, écriture disque se recouvrent ; l'inférence OCR
+    # elle-même reste sérialisée par le verrou du service).
+    # Borne aussi la RAM : au plus MAX_WORKERS pages décodées en vol.
+    MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+    def __init__(
+        self,
+        folder_path: str,
+        output_dir: str,
+        chapter_name: str,
+        create_pdf: bool,
+        lang_code: str,
+        ocr_service: OCRService,
+        translate_service: TranslateService,
+        render_service: RenderService,
+        batch_service: BatchService,
+    ):
+        super().__init__()
+        self.folder_path = folder_path
+        self.output_dir = output_dir
+        self.chapter_name = chapter_name
+        self.create_pdf = create_pdf
+        self.lang_code = lang_code
+        self.ocr_service = ocr_service
+        self.translate_service = translate_service
+        self.render_service = render_service
+        self.batch_service = batch_service
+
+        # Horodatage de la dernière émission de progression (throttling)
+        self._last_progress_emit = 0.0
+
+    def _emit_progress(self, current: int, total: int, status_text: str) -> None:
+        """
+        Émet la progression au plus ~20 fois/s.
+
+        Chaque emit est un appel inter-thread mis en file dans la boucle Qt
+        (marshalling d'une str Python compris) : sur un chapitre de 200 pages
+        les phases parallèles peuvent en produire des rafales bien plus
+        denses que ce que l'UI peut afficher. Les jalons (current == total)
+        et les erreurs passent toujours.
+
+        Un canal « entier seul » (signal int, sans str) n'apporterait rien
+        ici : avec ce throttle ≤ 20 chaînes/s traversent les threads, et la
+        fenêtre coalesce de son côté à 10 Hz avant de toucher aux widgets.
+        """
+        now = time.monotonic()
+        if current == total or "⚠" in status_text or now - self._last_progress_emit > 0.05:
+            self._last_progress_emit = now
+            self.progress.emit(current, total, status_text)
+
+    def _ocr_one(self, idx: int, img_path: str) -> PageOcr:
+        """Phase OCR d'une page (le décodage est mis en cache par le service)"""
+        return idx, img_path, self.ocr_service.run(img_path, self.lang_code)
+
+    def _render_one(self, idx: int, img_path: str, ocr_results: list,
+                    translation_map: Dict[str, str]) -> Tuple[int, str]:
+        """
+        Phase rendu d'une page : récupère l'image décodée (cache OCR, sinon
+        relecture disque), rend le texte traduit et exporte immédiatement.
+
+        Returns:
+            (index d'origine, chemin de l'image exportée)
+        """
+        img_name = Path(img_path).name
+
+        img_bgr = self.ocr_service.get_cached_original(img_path)
+        if img_bgr is None:
+            img_bgr = load_image_bgr(img_path)
+        if img_bgr is None:
+            raise RuntimeError(f"Impossible de charger l'image : {img_path}")
+
+        # Un seul passage sur les résultats : textes et boxes dépaquetés ensemble
+        if ocr_results:
+            texts, _confs, boxes = zip(*ocr_results)
+            translations = [translation_map.get(t.strip(), t) for t in texts]
+        else:
+            boxes, translations = (), []
+
+        # Page sans traduction exploitable (SFX seuls, échec traduction) :
+        # inpainter pour ne rien écrire par-dessus effacerait le texte
+        # d'origine — on exporte la page telle quelle, sans passe OpenCV
+        if any(t.strip() for t in translations):
+            rendered_img = self.render_service.render_translated_image(img_bgr, list(boxes), translations)
+        else:
+            rendered_img = img_bgr
+
+        return idx, self.batch_service.export_single_image(img_name, rendered_img, self.output_dir)
+
+    def run(self):
+        """Process all images in folder"""
+        try:
+            # 1) Scan folder
+            self._emit_progress(0, 100, "Scan du dossier...")
+            image_paths = self.batch_service.scan_folder(self.folder_path)
+
+            if not image_paths:
+                self.error.emit(f"Aucune image trouvée dans : {self.folder_path}")
+                return
+
+            total_images = len(image_paths)
+            self._emit_progress(0, total_images, f"Trouvé {total_images} images")
+
+            # 2) Phase OCR : toutes les pages en parallèle
+            pages: List[PageOcr] = []
+            done = 0
+
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._ocr_one, idx, img_path): img_path
+                    for idx, img_path in enumerate(image_paths, start=1)
+                }
+
+                for fut in as_completed(futures):
+                    done += 1
+                    img_name = Path(futures[fut]).name
+                    try:
+                        pages.append(fut.result())
+                        self._emit_progress(done, total_images, f"OCR {img_name} ({done}/{total_images})")
+                    except Exception as e:
+                        # Continue even if one image fails
+                        self._emit_progress(done, total_images, f"⚠ Erreur OCR sur {img_name}: {str(e)[:50]}")
+
+            if not pages:
+                self.error.emit("Aucune image n'a pu être traitée avec succès")
+                return
+
+            # Remettre les pages dans l'ordre de lecture (as_completed les
+            # a livrées dans l'ordre d'achèvement)
+            pages.sort(key=lambda p: p[0])
+
+            # 3) Phase traduction : UN SEUL appel pour tout le chapitre.
+            # La latence HTTP (DeepL) ou le forward du modèle local est payée
+            # une fois au lieu d'une fois par page ; les textes sont dédupliqués
+            # sur l'ensemble du chapitre (SFX et noms récurrents).
+            all_texts = list(dict.fromkeys(
+                t.strip()
+                for (_idx, _path, ocr_results) in pages
+                for (t, _c, _b) in ocr_results
+                if t and t.strip()
+            ))
+
+            translation_map: Dict[str, str] = {}
+            if all_texts:
+                self._emit_progress(0, total_images, f"Traduction de {len(all_texts)} textes uniques...")
+                translated = self.translate_service.translate_many(all_texts)
+                translation_map = dict(zip(all_texts, translated))
+            else:
+                # Chapitre sans texte détecté (couvertures, pages d'art) :
+                # la phase traduction est sautée entièrement
+                self._emit_progress(0, total_images, "Aucun texte détecté — traduction sautée")
+
+            # 4) Phase rendu + export : en parallèle. Chaque page rendue est
+            # écrite sur disque immédiatement dans _render_one puis libérée
+            # (la RAM reste bornée aux pages en vol, jamais O(N pages)).
+            # La liste de résultats est pré-allouée et remplie par position :
+            # l'ordre de lecture du chapitre est préservé sans tri final.
+            slots: List[Optional[Tuple[int, str]]] = [None] * len(pages)
+            done = 0
+
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._render_one, idx, img_path, ocr_results, translation_map): (pos, img_path)
+                    for pos, (idx, img_path, ocr_results) in enumerate(pages)
+                }
+
+                for fut in as_completed(futures):
+                    done += 1
+                    pos, img_path = futures[fut]
+                    img_name = Path(img_path).name
+                    try:
+                        slots[pos] = fut.result()
+                        self._emit_progress(done, total_images, f"Rendu {img_name} ({done}/{total_images})")
+                    except Exception as e:
+                        self._emit_progress(done, total_images, f"⚠ Erreur rendu sur {img_name}: {str(e)[:50]}")
+
+            results = [r for r in slots if r is not None]
+            if not results:
+                self.error.emit("Aucune image n'a pu être traitée avec succès")
+                return
+
+            exported_imgs = [path for (_idx, path) in results]
+
+            # 5) PDF multi-pages (en streaming depuis les fichiers exportés)
+            pdf_path = None
+            if self.create_pdf:
+                self._emit_progress(total_images, total_images, "Création du PDF multi-pages...")
+                pdf_path = str(Path(self.output_dir) / f"{self.chapter_name}.pdf")
+                self.batch_service.create_multi_page_pdf(exported_imgs, pdf_path)
+
+            self.finished.emit(exported_imgs, pdf_path or "")
+
+        except Exception as e:
+            self.error.emit(str(e))
@@ -27,15 +27,28 @@ class DownloadWorker(QObject):
         self.base_output_dir = base_output_dir
         self.download_service = download_service
         self.auto_process = auto_process
+        self.stop_requested = False  # Flag pour arrêter le téléchargement
+
+    def stop(self):
+        """Demande l'arrêt du téléchargement"""
+        self.stop_requested = True
 
     def run(self):
         """Download chapter images"""
         try:
+            # Callback avec vérification du stop
+            def progress_with_stop(i, t, s):
+                if self.stop_requested:
+                    raise InterruptedError("Téléchargement arrêté par l'utilisateur")
+                self.progress.emit(i, t, s)
+
             manga_name, chapter_name, downloaded_files = self.download_service.download_chapter(
                 self.chapter_url,
                 self.base_output_dir,
-                progress_callback=lambda i, t, s: self.progress.emit(i, t, s)
+                progress_callback=progress_with_stop
             )
-            self.finished.emit(manga_name, chapter_name, downloaded_files)
+
+            if not self.stop_requested:
+                self.finished.emit(manga_name, chapter_name, downloaded_files)
         except Exception as e:
             self.error.emit(str(e))
@@ -1,78 +1,97 @@
-# -*- coding: utf-8 -*-
-"""Worker for OCR and translation operations"""
-from __future__ import annotations
-
-from typing import List, Tuple
-
-from PySide6.QtCore import QObject, Signal
-
-from app.services.ocr_service import OCRService
-from app.services.translate_service import TranslateService, TranslatorMode
-
-
-# (text, conf, box)
-OcrResult = Tuple[str, float, list]
-
-
-class OCRTranslateWorker(QObject):
-    """Background worker for OCR and translation"""
-    finished = Signal(list, list)  # ocr_results, translations
-    error = Signal(str)
-    progress = Signal(int)
-
-    def __init__(
-        self,
-        image_path: str,
-        lang_code: str,
-        ocr_service: OCRService,
-        translate_service: TranslateService,
-        translate_mode: TranslatorMode,
-        api_key: str,
-        src_lang_ui: str,
-        tgt_lang_ui: str,
-        auto_fallback: bool,
-    ):
-        super().__init__()
-        self.image_path = image_path
-        self.lang_code = lang_code
-        self.ocr_service = ocr_service
-        self.translate_service = translate_service
-        self.translate_mode = translate_mode
-        self.api_key = api_key
-        self.src_lang_ui = src_lang_ui
-        self.tgt_lang_ui = tgt_lang_ui
-        self.auto_fallback = auto_fallback
-
-    def run(self):
-        """Execute OCR and translation"""
-        try:
-            self.progress.emit(5)
-
-            # 1) OCR
-            ocr_results: List[OcrResult] = self.ocr_service.run(self.image_path, self.lang_code)
-            self.progress.emit(70)
-
-            # 2) Translation
-            texts = [t for (t, _c, _b) in ocr_results]
-            translations: List[str] = []
-
-            if texts:
-                mode_txt = (self.translate_mode or "").strip().lower()
-                mode: TranslatorMode = "online" if mode_txt == "online" else "local"
-
-                self.translate_service.set_settings(
-                    mode=mode,
-                    api_key=self.api_key,
-                    src_lang=self.src_lang_ui,
-                    tgt_lang=self.tgt_lang_ui,
-                    auto_fallback_to_local=bool(self.auto_fallback and (self.api_key or "").strip()),
-                    provider="deepl",
-                )
-
-                translations = self.translate_service.translate_many(texts)
-
-            self.progress.emit(100)
-            self.finished.emit(ocr_results, translations)
-
-        except Exception as e:
-            self.error.emit(str(e))
+# -*- coding: utf-8 -*-
+"""Worker for OCR and translation operations"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import cv2
+from PySide6.QtCore import QObject, Signal
+
+from app.services.ocr_service import OCRService
+from app.services.render_service import RenderService
+from app.services.translate_service import TranslateService
+
+
+# (text, conf, box)
+OcrResult = Tuple[str, float, list]
+
+
+class OCRTranslateWorker(QObject):
+    """Background worker for OCR and translation"""
+    finished = Signal(list, list, object)  # ocr_results, translations, rendered_img (or None)
+    error = Signal(str)
+    progress = Signal(int)
+
+    def __init__(
+        self,
+        image_path: str,
+        lang_code: str,
+        ocr_service: OCRService,
+        translate_service: TranslateService,
+        render_service: Optional[RenderService] = None,
+        do_render: bool = False,
+    ):
+        super().__init__()
+        self.image_path = image_path
+        self.lang_code = lang_code
+        self.ocr_service = ocr_service
+        self.translate_service = translate_service
+        self.render_service = render_service
+        self.do_render = do_render
+
+    def run(self):
+        """Execute OCR and translation"""
+        try:
+            self.progress.emit(5)
+
+            # 1) OCR
+            ocr_results: List[OcrResult] = self.ocr_service.run(self.image_path, self.lang_code)
+            self.progress.emit(70)
+
+            # 2) Translation
+            # Dépaquetage SoA en un seul passage : textes et boxes sont
+            # extraits ensemble (le rendu réutilise boxes plus bas)
+            if ocr_results:
+                texts, _confs, boxes = (list(col) for col in zip(*ocr_results))
+            else:
+                texts, boxes = [], []
+            translations: List[str] = []
+
+            # Le service arrive pré-configuré : la fenêtre synchronise
+            # set_settings dès qu'un widget de traduction change, plus
+            # aucun travail de configuration dans le chemin chaud
+            # Fail-fast : une page sans texte exploitable (couverture, art)
+            # ne touche pas du tout au service de traduction
+            if any(t.strip() for t in texts):
+                # Dédupliquer et filtrer les vides avant l'appel, puis
+                # redistribuer par dict : les SFX répétés ne partent qu'une
+                # fois, et translations reste aligné 1:1 avec les boxes même
+                # si le service écarte des entrées (texte blanc → "")
+                uniq = [t for t in dict.fromkeys(texts) if t.strip()]
+                tr_uniq = self.translate_service.translate_many(uniq)
+                mapping = dict(zip(uniq, tr_uniq))
+                translations = [mapping.get(t, "") for t in texts]
+            else:
+                translations = ["" for _ in texts]
+
+            # 3) Rendu optionnel dans le même thread : évite un second décodage
+            #    de l'image et un aller-retour UI avant le clic "Appliquer"
+            rendered_img = None
+            if (self.do_render and self.render_service is not None and ocr_results
+                    and any(t.strip() for t in translations)):
+                self.progress.emit(85)
+
+                img_bgr = self.ocr_service.get_cached_original(self.image_path)
+                if img_bgr is None:
+                    img_bgr = cv2.imread(self.image_path)
+
+                if img_bgr is not None:
+                    rendered_img = self.render_service.render_translated_image(
+                        img_bgr, boxes, translations
+                    )
+
+            self.progress.emit(100)
+            self.finished.emit(ocr_results, translations, rendered_img)
+
+        except Exception as e:
+            self.error.emit(str(e))
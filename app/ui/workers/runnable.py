@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Adapter to run QObject workers on the global QThreadPool"""
+from __future__ import annotations
+
+from PySide6.QtCore import QRunnable
+
+
+class WorkerRunnable(QRunnable):
+    """
+    Exécute un worker existant (QObject avec méthode run()) sur le
+    QThreadPool global, au lieu de créer un QThread dédié par clic.
+
+    Les threads du pool sont recyclés entre les jobs : plus de coût de
+    création/destruction de thread ni de chorégraphie quit/deleteLater.
+    Les signaux du worker restent délivrés au thread GUI via les
+    connexions queued automatiques de Qt.
+    """
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.worker.run()
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# app/utils/hashing.py
+"""
+Hachage rapide de contenu d'images (clés de cache)
+"""
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+
+
+def image_content_key(img: np.ndarray) -> str:
+    """
+    Retourne une clé de cache basée sur le contenu décodé d'une image.
+
+    blake2b hache à ~1 Go/s, négligeable devant le coût d'un OCR, et la clé
+    est indépendante du chemin du fichier : pages re-téléchargées ou
+    dupliquées (logos, pages de récap) partagent la même entrée de cache.
+
+    Args:
+        img: Image numpy (typiquement BGR OpenCV)
+
+    Returns:
+        Clé hexadécimale (128 bits)
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(img).data)
+    h.update(str(img.shape).encode("ascii"))
+    return h.hexdigest()
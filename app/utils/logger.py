@@ -4,6 +4,7 @@
 Systeme de logging centralise pour Manga Translator Pro
 """
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
@@ -44,10 +45,16 @@ def setup_logger(
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # File handler (optionnel)
+    # File handler (optionnel) — rotation pour borner l'usage disque sur
+    # les longues sessions (10 Mo par fichier, 5 archives conservées)
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=10 * 1024 * 1024,
+            backupCount=5,
+            encoding='utf-8',
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)